@@ -0,0 +1,156 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the evaluator runs as pure Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+# A, 2, 3, 4, 5 as a 13-bit rank mask (rank 0 is the deuce)
+_WHEEL = 0b1000000001111
+
+
+@njit(cache=True)
+def _straight_top(mask : int):
+    """
+    Top card rank of the straight in a 13-bit rank mask,
+    -1 if the mask holds no straight. The wheel (A-2-3-4-5)
+    counts with the 5 (rank 3) as its top card.
+    """
+    for top in range(12, 3, -1):
+        if (mask >> (top - 4)) & 0b11111 == 0b11111:
+            return top
+    if mask & _WHEEL == _WHEEL:
+        return 3
+    return -1
+
+
+@njit(cache=True)
+def _highest_bit(mask : int):
+    """
+    Rank of the highest set bit in a 13-bit rank mask
+    """
+    for rank in range(12, -1, -1):
+        if (mask >> rank) & 1:
+            return rank
+    return -1
+
+
+@njit(cache=True)
+def eval_hand(cards):
+    """
+    Rank a hand of 2-7 packed 32-bit cards.
+
+    Scores follow the same 13-wide bands as PokerRank:
+    high card 0-12, pair +13, two pairs +26, 3 of a kind +39,
+    straight +52, flush +65, full house +78, 4 of a kind +91,
+    straight flush +104, royal flush 117.
+
+    Args:
+        cards (np.ndarray): packed 32-bit cards
+
+    Returns:
+        score (int): the rank of the hand
+    """
+    suit_masks = np.zeros(4, dtype=np.int64)
+    rcount = np.zeros(13, dtype=np.int8)
+    for i in range(cards.shape[0]):
+        card = cards[i]
+        rank = (card >> 8) & 0xF
+        nibble = (card >> 12) & 0xF
+        if nibble == 1:
+            suit = 0
+        elif nibble == 2:
+            suit = 1
+        elif nibble == 4:
+            suit = 2
+        else:
+            suit = 3
+        suit_masks[suit] |= 1 << rank
+        rcount[rank] += 1
+
+    rank_mask = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+
+    # rank multiplicities from highest rank down
+    quad, trips, trips2, pair1, pair2, high = -1, -1, -1, -1, -1, -1
+    for rank in range(12, -1, -1):
+        n = rcount[rank]
+        if n == 0:
+            continue
+        if high < 0:
+            high = rank
+        if n == 4 and quad < 0:
+            quad = rank
+        elif n == 3:
+            if trips < 0:
+                trips = rank
+            elif trips2 < 0:
+                trips2 = rank
+        elif n == 2:
+            if pair1 < 0:
+                pair1 = rank
+            elif pair2 < 0:
+                pair2 = rank
+
+    # flush suit, if any
+    flush_suit = -1
+    for suit in range(4):
+        mask = suit_masks[suit]
+        count = 0
+        while mask:
+            mask &= mask - 1
+            count += 1
+        if count >= 5:
+            flush_suit = suit
+
+    if flush_suit >= 0:
+        top = _straight_top(suit_masks[flush_suit])
+        if top == 12:
+            return 117
+        if top >= 0:
+            return 104 + top
+    if quad >= 0:
+        return 91 + quad
+    if trips >= 0 and (trips2 >= 0 or pair1 >= 0):
+        return 78 + trips
+    if flush_suit >= 0:
+        return 65 + _highest_bit(suit_masks[flush_suit])
+    top = _straight_top(rank_mask)
+    if top >= 0:
+        return 52 + top
+    if trips >= 0:
+        return 39 + trips
+    if pair2 >= 0:
+        return 26 + pair1
+    if pair1 >= 0:
+        return 13 + pair1
+    return high
+
+
+@njit(cache=True)
+def eval_hands(hands):
+    """
+    Rank a batch of hands in one call.
+
+    Args:
+        hands (np.ndarray): (n, k) matrix of packed 32-bit cards
+
+    Returns:
+        scores (np.ndarray): the rank of each hand
+    """
+    scores = np.empty(hands.shape[0], dtype=np.int16)
+    for i in range(hands.shape[0]):
+        scores[i] = eval_hand(hands[i])
+    return scores
+
+
+# warm the JIT at import so the first hand does not pay compile latency
+_warmup = np.array([[(1 << 16) | (1 << 12) | 2,
+                     (1 << 17) | (1 << 13) | (1 << 8) | 3]], dtype=np.uint32)
+eval_hands(_warmup)
@@ -1,10 +1,15 @@
 import numpy as np
-import torch
-from torch.distributions import Normal
+from collections import deque
 from rules import PokerRank
 from mapper import Mapper
+from evaluator import eval_hands
 from typing import Optional
 
+# actions and decisions are int codes end to end; strings only exist
+# in the print layer via DECISION_STR
+NONE, FOLD, CHECK, RAISE, ALLIN = 0, 1, 2, 3, 4
+DECISION_STR = ('', 'fold', 'check', 'raise', 'all-in')
+
 
 class PokerSimulator:
     """ 
@@ -22,21 +27,58 @@ class PokerSimulator:
         small_blind (int): small blind of the game
 
     """
-    def __init__(self, 
+    BOT_ACTIONS = (FOLD, CHECK, RAISE, ALLIN)
+    # cumulative action probabilities per (cards_shown, strong hand) bucket
+    BOT_CUM = np.array([[0.2, 0.9, 0.99, 1.0],    # pre-flop, weak
+                        [0.08, 0.88, 0.98, 1.0],  # pre-flop, strong
+                        [0.3, 0.9, 0.99, 1.0],    # flop, weak
+                        [0.05, 0.8, 0.99, 1.0],   # flop, strong
+                        [0.8, 0.98, 0.99, 1.0],   # turn, weak
+                        [0.1, 0.9, 0.99, 1.0],    # turn, strong
+                        [0.9, 0.98, 0.99, 1.0],   # river, weak
+                        [0.1, 0.9, 0.99, 1.0]])   # river, strong
+    _SEP = '-' * 50
+    _INPUT_KEYS = {'f': FOLD, 'c': CHECK, 'r': RAISE, 'a': ALLIN}
+    _BOT_ROW = {(0, False): 0, (0, True): 1,
+                (3, False): 2, (3, True): 3,
+                (4, False): 4, (4, True): 5,
+                (5, False): 6, (5, True): 7}
+
+    def __init__(self,
                  n_players : int = 6, 
                  buy_in : int = 1000, 
                  small_blind : int = 10,
-                 big_blind : int = 20):
-        
+                 big_blind : int = 20,
+                 verbose : bool = True):
+
         self.n_players = n_players
-        self.small_blind = small_blind
-        self.big_blind = big_blind
-        self.last_bet = big_blind
+        self.verbose = verbose
+        # money is integer-valued end to end; no FP rounding in the pot
+        self.small_blind = int(small_blind)
+        self.big_blind = int(big_blind)
+        self.last_bet = self.big_blind
         self.mapper = Mapper()
+        # packed 32-bit card lookup, indexed by deck integer 0-51
+        self._cactus = self.mapper.cactus
+        self._rng = np.random.default_rng()
      
         self.n_rounds = 0
-        self.player_money = {player: buy_in for player in range(self.n_players)}
-        self.order_of_play = [player for player in range(self.n_players)]
+        # seat-indexed state arrays; seats never move, masks track who is in
+        self.n_seats = n_players
+        self.buy_in = int(buy_in)
+        self.money = np.full(n_players, self.buy_in, dtype=np.int64)
+        self.decision = np.zeros(n_players, dtype=np.int8)
+        self.bets = np.zeros(n_players, dtype=np.int64)
+        # reusable deck buffer, shuffled in place each round
+        self._deck = np.arange(52)
+        # when True, player 0 is played by the bot policy (headless batches)
+        self._auto_play = False
+        self.order_of_play = deque(range(self.n_players))
+        # inverse of order_of_play, player -> seat index, for O(1) lookups
+        self._seat_of = {player: i for i, player in enumerate(self.order_of_play)}
+        # bound-method dispatch table, built once instead of an if/elif ladder per bet
+        self._actions = {FOLD: self.fold, CHECK: self.check,
+                         RAISE: self.raise_money, ALLIN: self.all_in}
         # initialize the game
         self.instantiate()
     
@@ -44,72 +86,89 @@ class PokerSimulator:
         """ 
         Reset for next round
         """
-        print('\nStarting new round')
+        if self.verbose:
+            print('\nStarting new round')
         if self.n_rounds > 0:
             self.rotate()
         
         self.last_bet = self.big_blind
-        players = [player for player in self.player_money.keys() if self.player_money[player] > 0]
+        self.alive = self.money > 0
+        players = [int(player) for player in np.flatnonzero(self.alive)]
         self.n_players = len(players)
-        self.decision_holder = {player : None for player in players}
-        self.player_bets = {player : 0 for player in players}
-        deck = np.arange(52)
-        self.cards_to_table = np.random.choice(deck, 5 + self.n_players * 2, replace=False)
-        self.deck = np.setdiff1d(deck, self.cards_to_table)
-        cards_on_table = self.cards_to_table[:5]
-
-        self.cards_on_table = [self.get_card(card) for card in cards_on_table]
+        self.decision[:] = NONE
+        self.bets[:] = 0
+        # street counters so termination checks stay O(1)
+        self._n_broke = 0
+        self._n_decided = 0
+        self._n_finalized = 0
+        # hand strengths evaluated this round, keyed by (player, cards_shown)
+        self._rank_cache = {}
+        # one in-place shuffle deals table, hands, and remaining deck in slices
+        self._rng.shuffle(self._deck)
+        n_dealt = 5 + self.n_players * 2
+        self.cards_to_table = self._deck[:n_dealt]
+        self.deck = self._deck[n_dealt:]
+        # single gathers on the packed-card table instead of per-card get_card calls
+        self.cards_on_table = self._cactus[self.cards_to_table[:5]]
         self.player_cards = self.cards_to_table[5:].reshape(self.n_players, 2)
-        self.player_hands = {}
-        
-        for i, player in enumerate(players):
-            cards = self.player_cards[i]
-            self.player_hands[player] = [self.get_card(card) for card in cards]
-            if player == 0:
-                print('\nYour cards:')
-                self.print_cards(self.player_hands[player])
+        self.player_hands = {player : self._cactus[self.player_cards[i]] for i, player in enumerate(players)}
+
+        if 0 in self.player_hands and self.verbose:
+            print('\nYour cards:')
+            self.print_cards(self.player_hands[0])
                 
         self.n_rounds += 1
         
     
     def get_suit(self, card : int):
-        """ 
-        Get the suit of a card
+        """
+        Get the suit of a packed card
 
         Args:
-            card (int): a card
+            card (int): a packed 32-bit card
 
         Returns:
             suit (int): the suit of the card
         """
-        return card // 13
-    
+        return self.mapper.cactus_suit(card)
+
     def get_rank(self, card : int):
-        """ 
-        Get the rank of a card
+        """
+        Get the rank of a packed card
 
         Args:
-            card (int): a card
+            card (int): a packed 32-bit card
 
         Returns:
             rank (int): the rank of the card
         """
-        return card % 13
-    
+        return self.mapper.cactus_rank(card)
+
     def get_card(self, card : int):
-        """ 
-        1-4: 2 of clubs, 2 of diamonds, 2 of hearts, 2 of spades
-        5-8: 3 of clubs, 3 of diamonds, 3 of hearts, 3 of spades etc.
+        """
+        Map a deck integer 0-51 to its packed 32-bit card.
+        0-3: 2 of clubs, 3 of clubs, ... in deck order
+        suit is the integer division by 13, rank the remainder.
 
         Args:
-            card (int): a card
-        
+            card (int): a deck integer
+
+        Returns:
+            card as packed 32-bit int (rank bit, suit bit, rank, prime)
+        """
+        return int(self._cactus[card])
+
+    def to_tuples(self, cards):
+        """
+        Convert packed cards to (suit, rank) tuples for PokerRank
+
+        Args:
+            cards (list): packed 32-bit cards
+
         Returns:
-            card as tuple (suit, rank)
+            cards as list of tuples (suit, rank)
         """
-        suit = self.get_suit(card)
-        rank = self.get_rank(card)
-        return (suit, rank)
+        return self.mapper.to_tuples(cards)
 
     def set_bot_probs(self, hand_strength : int, cards_shown : int):
         """ 
@@ -124,26 +183,32 @@ class PokerSimulator:
         Returns:
             probs (list): list of probabilities for each action
         """ 
-        if hand_strength <= 6 and cards_shown == 0:
-            probs = [0.2, 0.7, 0.09, 0.01]
-        elif hand_strength > 6 and cards_shown == 0:
-            probs = [0.08, 0.8, 0.1, 0.02]
-        elif hand_strength <= 13 and cards_shown == 3:
-            probs = [0.3, 0.6, 0.09, 0.01]
-        elif hand_strength > 13 and cards_shown == 3:
-            probs = [0.05, 0.75, 0.19, 0.01]
-        elif hand_strength <= 13 and cards_shown == 4:
-            probs = [0.8, 0.18, 0.01, 0.01]
-        elif hand_strength > 13 and cards_shown == 4:
-            probs = [0.1, 0.8, 0.09, 0.01]
-        elif hand_strength <= 13 and cards_shown == 5:
-            probs = [0.9, 0.08, 0.01, 0.01]
-        elif hand_strength > 13 and cards_shown == 5:
-            probs = [0.1, 0.8, 0.09, 0.01]
-      
-        
-        action = np.random.choice(['fold', 'check', 'raise', 'all-in'], p=probs)
-        return action
+        strong = hand_strength > (6 if cards_shown == 0 else 13)
+        row = self._BOT_ROW[(cards_shown, strong)]
+        # invert one uniform draw through the cumulative table
+        r = self._rng.random()
+        return self.BOT_ACTIONS[int(np.searchsorted(self.BOT_CUM[row], r))]
+
+    def draw_bot_actions(self, bots : list, bot_ranks : dict, cards_shown : int):
+        """
+        Draw actions for all bots on a street with a single vectorized sample
+        instead of one RNG call per bot.
+
+        Args:
+            bots (list): the bot players
+            bot_ranks (dict): hand strength per bot
+            cards_shown (int): number of cards shown on the table
+
+        Returns:
+            actions (dict): sampled action per bot
+        """
+        if not bots:
+            return {}
+        threshold = 6 if cards_shown == 0 else 13
+        rows = np.array([self._BOT_ROW[(cards_shown, bot_ranks[player] > threshold)] for player in bots])
+        u = self._rng.random(len(bots))
+        idx = (self.BOT_CUM[rows] < u[:, None]).sum(axis=1)
+        return {player : self.BOT_ACTIONS[i] for player, i in zip(bots, idx)}
     
     def verify_bet(self, player : int, amount : float):
         """
@@ -156,76 +221,81 @@ class PokerSimulator:
         Returns:
             valid (bool): True if the bet is valid, False otherwise
         """
-        if amount > self.player_money[player]:
-            amount = self.player_money[player]
-            self.player_money[player] = 0
+        money = self.money[player]
+        if amount > money:
+            amount = money
+            self.money[player] = 0
             valid = False
-        
+
         else:
-            self.player_money[player] -= amount
+            self.money[player] = money - amount
             valid = True
-        
-        self.player_bets[player] += amount
-        self.last_bet = self.player_bets[player] if self.player_bets[player] > self.last_bet else self.last_bet
+
+        if money > 0 and self.money[player] == 0:
+            self._n_broke += 1
+        self.bets[player] += amount
+        self.last_bet = self.bets[player] if self.bets[player] > self.last_bet else self.last_bet
 
         return valid
     
     def remove_player(self, player : int):
-        """ 
+        """
         Remove player from round
         """
         self.n_players -= 1
+        self.alive[player] = False
         del self.player_hands[player]
-        del self.decision_holder[player]
-        del self.player_bets[player]
-        del self.player_money[player]
         self.order_of_play.remove(player)
+        self._seat_of = {player: i for i, player in enumerate(self.order_of_play)}
         
     def fold(self, player : int):
         """ 
         If fold is called, the player is out of the game.
         """
         # check if player is either small blind or big blind
-        if self.order_of_play[player] == self.n_players - 2 and self.player_bets[player] < self.small_blind:
-            amount = self.small_blind - self.player_bets[player]
+        if self.order_of_play[player] == self.n_players - 2 and self.bets[player] < self.small_blind:
+            amount = self.small_blind - self.bets[player]
             self.verify_bet(player=player, amount=amount)
-        elif self.order_of_play[player] == self.n_players - 1 and self.player_bets[player] < self.big_blind:
-            amount = self.big_blind - self.player_bets[player]
+        elif self.order_of_play[player] == self.n_players - 1 and self.bets[player] < self.big_blind:
+            amount = self.big_blind - self.bets[player]
             self.verify_bet(player=player, amount=amount)
         self.n_players -= 1
-        print(f'Player {player+1} folds | Amount left {self.player_money[player]:.0f}')
-        print('-'*50)
+        if self.verbose:
+            print(f'Player {player+1} folds | Amount left {self.money[player]:d}')
+            print(self._SEP)
     
     def check(self, player : int):
         """ 
         Check and call is used interchangeably.
         If check is called, the player can continue to play.
         """
-        if self.player_bets[player] <= self.last_bet:
-            amount = self.last_bet - self.player_bets[player]
+        if self.bets[player] <= self.last_bet:
+            amount = self.last_bet - self.bets[player]
             # check if player can afford the bet
-            self.last_bet = self.player_bets[player] if self.player_bets[player] > self.last_bet else self.last_bet
+            self.last_bet = self.bets[player] if self.bets[player] > self.last_bet else self.last_bet
             valid = self.verify_bet(player=player, amount=amount)
             decision = 'checks/calls' if valid else 'all-in'
 
-            print(f'Player {player+1} {decision} | Amount left: {self.player_money[player]:.0f}')
-            print('-'*50)
+            if self.verbose:
+                print(f'Player {player+1} {decision} | Amount left: {self.money[player]:d}')
+                print(self._SEP)
             
     def raise_money(self, player : int,):
         """ 
         The raise is drawn from a normal distribution with mean 1/5 of the player's money
         and standard deviation 1/10 of the player's money. Minimum raise is the big blind.
         """
-        player_money = self.player_money[player]
+        player_money = self.money[player]
         if player_money < self.big_blind:
             self.all_in(player=player)
         else:
-            bet_dist = Normal(loc=player_money / 5, scale=player_money / 10)
-            amount = torch.clamp(bet_dist.sample(), min=self.last_bet, max=player_money).item()
+            sample = self._rng.normal(loc=player_money / 5, scale=player_money / 10)
+            amount = min(max(int(round(sample)), self.last_bet), player_money)
             valid = self.verify_bet(player=player, amount=amount)
             decision = 'raises' if valid else 'all-in'
-            print(f'Player {player+1} {decision} {amount:.0f} | Amount left: {self.player_money[player]:.0f}')
-            print('-'*50)
+            if self.verbose:
+                print(f'Player {player+1} {decision} {amount:d} | Amount left: {self.money[player]:d}')
+                print(self._SEP)
         
 
     def all_in(self, player : int):
@@ -233,21 +303,21 @@ class PokerSimulator:
         The all-in matches the money of the player calling the all-in.
         """
         # check that player has enough money
-        amount = self.player_money[player]
+        amount = self.money[player]
         if amount < self.big_blind:
             amount = self.big_blind
 
         self.verify_bet(player=player, amount=amount)
-        print(f'Player {player+1} all-in {amount:.0f} | Amount left: {self.player_money[player]:.0f}')
-        print('-'*50)
+        if self.verbose:
+            print(f'Player {player+1} all-in {amount:d} | Amount left: {self.money[player]:d}')
+            print(self._SEP)
 
     def rotate(self):
         """
         move all values one step forward, last value becomes first
         """
-        order_copy = self.order_of_play.copy()
-        self.order_of_play[0] = order_copy[-1]
-        self.order_of_play[1:] = order_copy[:-1]
+        self.order_of_play.rotate(1)
+        self._seat_of = {player: i for i, player in enumerate(self.order_of_play)}
     
     def player_input(self):
         """ 
@@ -255,21 +325,17 @@ class PokerSimulator:
         """
         action = input('(f)old, (c)heck, (r)aise, (a)ll-in): ')
         print('\n')
-        if action == 'f':
-            return 'fold'
-        elif action == 'c':
-            return 'check'
-        elif action == 'r':
-            return 'raise'
-        elif action == 'a':
-            return 'all-in'
-        else:
+        try:
+            return self._INPUT_KEYS[action]
+        except KeyError:
             raise ValueError('Invalid action')
     
     def print_winner(self, winner : list):
         """ 
         Determine single winner before river
         """
+        if not self.verbose:
+            return
         winner_list = [f'Player {w+1}' for w in winner]
         winner = ', '.join(winner_list)
         print(f'\nWinner(s) is/are: {winner}\n')
@@ -286,28 +352,25 @@ class PokerSimulator:
         pass 
 
     def is_game_over(self):
-        """ 
+        """
         Check if only one player still has money to play
         """
-        money = list(self.player_money.values())
         # if only one player has money left, the player wins and the game is over
-        count = [m >= self.big_blind for m in money]
-        if sum(count) == 1:
-            return True
-        return False
+        return np.count_nonzero(self.money >= self.big_blind) == 1
     
     def showdown(self, players : list):
         """ 
         Showdown
         """
         player_hands = {player : self.player_hands[player] for player in players}
-        print('\n')
-        for player, cards in player_hands.items():
-            print(f'Player {player+1}: {self.mapper.card_string(cards[0])} {self.mapper.card_string(cards[1])}')
-            print('-'*50)
+        if self.verbose:
+            print('\n')
+            for player, cards in player_hands.items():
+                print(f'Player {player+1}: {self.mapper.card_string(cards[0])} {self.mapper.card_string(cards[1])}')
+                print(self._SEP)
         rules = PokerRank(player_hands=player_hands,
                           table_cards=self.cards_on_table,
-                          verbose=True)
+                          verbose=self.verbose)
         winner = rules.get_winner()
         self.distribute_pot(winner)
     
@@ -315,87 +378,133 @@ class PokerSimulator:
         """ 
         Print cards
         """
+        if not self.verbose:
+            return
         cards_string = [f'|{self.mapper.card_string(card)}|' for card in cards]
         cards = ' '.join(cards_string)
-        print('-'*50)
+        print(self._SEP)
         print(f'{cards}')
-        print('-'*50 + '\n')
+        print(self._SEP + '\n')
 
-    def player_action(self, player : int, action : str):
-        """ 
+    def _set_decision(self, player : int, action : int):
+        """
+        Update a player's decision and keep the street counters in sync
+        """
+        prev = self.decision[player]
+        if prev == NONE and action != NONE:
+            self._n_decided += 1
+        elif prev != NONE and action == NONE:
+            self._n_decided -= 1
+        if prev == FOLD or prev == ALLIN:
+            self._n_finalized -= 1
+        if action == FOLD or action == ALLIN:
+            self._n_finalized += 1
+        self.decision[player] = action
+
+    def _recount_decisions(self):
+        """
+        Rebuild the street counters after a bulk reset of decisions
+        """
+        decisions = self.decision[self.alive]
+        self._n_decided = int(np.count_nonzero(decisions))
+        self._n_finalized = int(np.count_nonzero((decisions == FOLD) | (decisions == ALLIN)))
+
+    def player_action(self, player : int, action : int):
+        """
         Action of a player
         """
-        if action == 'fold':
-            self.fold(player=player)
-        elif action == 'check':
-            self.check(player=player)
-        elif action == 'raise':
-            self.raise_money(player=player)
-        elif action == 'all-in':
-            self.all_in(player=player)
-        else:
+        try:
+            act = self._actions[action]
+        except KeyError:
             raise ValueError('Invalid action')
-        
-        self.decision_holder[player] = action
+        act(player=player)
+
+        self._set_decision(player, action)
     
-    def get_players_in_round(self, player : int, action : str):
+    def get_players_in_round(self, player : int, action : int):
         """ 
         Update which players are still in the round, and the decision(s)
         based on subsequent player actions
         """
-        if action in ['raise', 'all-in']:
+        if action == RAISE or action == ALLIN:
             # update the decision holder for all players that have not made a decision
-            idx = self.order_of_play.index(player)
+            idx = self._seat_of[player]
             # set to none for all players before the player that raised or went all-in
             for i in range(idx):
-                if self.decision_holder[self.order_of_play[i]] not in ['fold', 'all-in']:
-                    self.decision_holder[self.order_of_play[i]] = None
+                other = self.order_of_play[i]
+                if self.alive[other] and self.decision[other] != FOLD and self.decision[other] != ALLIN:
+                    self._set_decision(other, NONE)
         
     def player_moves(self, table_cards : list = None, cards_shown : int = 0):
         """ 
         Round of betting
         """
-        players = list(self.decision_holder.keys())
-        bot_hands = {player: self.player_hands[player] for player in self.decision_holder.keys() if player != 0}
-        
-        ranks = PokerRank(
-            player_hands=bot_hands,
-            table_cards=table_cards,
-            verbose=False
-        )
+        # nothing to bet on with one player left; skip the evaluator entirely
+        if np.count_nonzero(self.alive & (self.decision != FOLD)) <= 1:
+            return True
+
+        bot_hands = {player: self.player_hands[player] for player in self.player_hands
+                     if player != 0 or self._auto_play}
+
+        # only evaluate hands not already ranked for this street
+        uncached = [player for player in bot_hands
+                    if (player, cards_shown) not in self._rank_cache]
+        if uncached:
+            # stack hole + table cards and rank all hands in one evaluator call
+            n_table = 0 if table_cards is None else len(table_cards)
+            matrix = np.empty((len(uncached), 2 + n_table), dtype=np.uint32)
+            for i, player in enumerate(uncached):
+                matrix[i, :2] = bot_hands[player]
+                if n_table:
+                    matrix[i, 2:] = table_cards
+            for player, score in zip(uncached, eval_hands(matrix)):
+                self._rank_cache[(player, cards_shown)] = int(score)
         # used for bot decision probabilities
-        bot_ranks = ranks.rank_player_hands
+        bot_ranks = {player : self._rank_cache[(player, cards_shown)] for player in bot_hands}
+        # one vectorized draw covers the whole street; re-opened decisions
+        # after a raise fall back to the scalar sampler
+        pending_actions = self.draw_bot_actions(list(bot_hands.keys()), bot_ranks, cards_shown)
         n_players = self.n_players
+        # fold() decrements n_players across streets; the counter thresholds
+        # must cover every seat dealt into the round
+        n_in_round = int(np.count_nonzero(self.alive))
         while True:
             for player in self.order_of_play:
-                if all([self.player_money[player] == 0 for player in players]):
-                    print(f'Player(s) money, {self.player_money}. Round over')
+                if not self.alive[player]:
+                    continue
+                if self._n_broke == n_in_round:
+                    if self.verbose:
+                        print(f'Player(s) money, {self.money}. Round over')
                     return True
-                elif all([self.decision_holder[player] in ['fold', 'all-in'] for player in self.decision_holder.keys()]):
-                    print(f'Decisions: {self.decision_holder}. Round over')
+                elif self._n_finalized == n_in_round:
+                    if self.verbose:
+                        print(f'Decisions: {self.decision}. Round over')
                     return True
-                elif all([decision is not None for decision in self.decision_holder.values()]):
-                    print(f'Decisions: {self.decision_holder}. Round not over')
-                    return False    
-                elif self.player_money[player] == 0:
-                    self.decision_holder[player] = 'all-in'
-                    print(f'Decisions: {self.decision_holder}')
+                elif self._n_decided == n_in_round:
+                    if self.verbose:
+                        print(f'Decisions: {self.decision}. Round not over')
+                    return False
+                elif self.money[player] == 0:
+                    self._set_decision(player, ALLIN)
+                    if self.verbose:
+                        print(f'Decisions: {self.decision}')
                     continue
-                elif self.decision_holder[player] in ['fold', 'all-in']:
+                elif self.decision[player] == FOLD or self.decision[player] == ALLIN:
                     continue
-                
-                if player == 0 and self.decision_holder[player] is None:
+
+                if player == 0 and not self._auto_play and self.decision[player] == NONE:
                     action = self.player_input()
                     self.player_action(player=player, action=action)
                     self.get_players_in_round(player, action)
-                
-                elif self.decision_holder[player] is None:
-                    hand_strength = bot_ranks[player]
-                    action = self.set_bot_probs(hand_strength=hand_strength, cards_shown=cards_shown)
+
+                elif self.decision[player] == NONE:
+                    action = pending_actions.pop(player, None)
+                    if action is None:
+                        action = self.set_bot_probs(hand_strength=bot_ranks[player], cards_shown=cards_shown)
                     self.player_action(player=player, action=action)
                     self.get_players_in_round(player,action)
                 
-                if action == 'fold':
+                if action == FOLD:
                     n_players -= 1
                     if n_players == 1:
                         return True
@@ -410,26 +519,30 @@ class PokerSimulator:
         cards_shown = [0, 3, 4, 5]
 
         def players_in():
-            players = []
-            for player in self.decision_holder.keys():
-                if self.decision_holder[player] != 'fold':
-                    players.append(player)
-            return players
-        
-        for cards, stage in zip(cards_shown, stages): 
+            return [int(player) for player in np.flatnonzero(self.alive & (self.decision != FOLD))]
+
+        for cards, stage in zip(cards_shown, stages):
+            # everyone else folded; award the pot without playing the street
+            alive = players_in()
+            if len(alive) <= 1:
+                self.distribute_pot(alive)
+                return
+
             table_cards = self.cards_on_table[:cards]
-            print(f'\n{stage}')
+            if self.verbose:
+                print(f'\n{stage}')
             if stage != 'Pre-flop':
                 self.print_cards(table_cards)
-        
+
             round_over = self.player_moves(table_cards=table_cards, cards_shown=cards)
-            
+
             if round_over or stage == 'River':
-                self.showdown(players=[player for player in self.decision_holder.keys() if self.decision_holder[player] != 'fold'])
+                self.showdown(players=players_in())
                 break
             else:
-                players = players_in()
-                self.decision_holder = {player : None if player in players else self.decision_holder[player] for player in self.decision_holder.keys()}
+                # non-folded players decide again on the next street
+                self.decision[self.alive & (self.decision != FOLD)] = NONE
+                self._recount_decisions()
     
     def play(self):
         """ 
@@ -452,10 +565,37 @@ class PokerSimulator:
             else:
                 ctn = False
 
+    def run_batch(self, n_games : int):
+        """
+        Play n independent games headlessly, with player 0 driven by
+        the bot policy. Setup buffers are allocated once and reused,
+        and nothing is printed. Meant for RL self-play loops.
+
+        Args:
+            n_games (int): number of games to play
+
+        Returns:
+            outcomes (np.ndarray): (n_games, n_seats) money per seat after each game
+        """
+        verbose = self.verbose
+        self.verbose = False
+        self._auto_play = True
+        outcomes = np.empty((n_games, self.n_seats), dtype=np.int64)
+        try:
+            for i in range(n_games):
+                self.money[:] = self.buy_in
+                self.instantiate()
+                self.poker_round()
+                outcomes[i] = self.money
+        finally:
+            self._auto_play = False
+            self.verbose = verbose
+        return outcomes
+
 if __name__ == "__main__":
     N_PLAYERS = 6 # number of bots + 1 player
-    BUY_IN = 1e4
-    SMALL_BLIND = BUY_IN / 100
+    BUY_IN = 10_000
+    SMALL_BLIND = BUY_IN // 100
     BIG_BLIND = SMALL_BLIND * 2
     
     game = PokerSimulator(
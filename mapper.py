@@ -1,25 +1,98 @@
+import numpy as np
+
+SUITS = ["♣", "♦", "♥", "♠"]
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+
+# pre-formatted card strings indexed by suit * 13 + rank, built once at
+# import so card_string is a plain tuple index
+CARD_STR = tuple(RANKS[card % 13] + SUITS[card // 13] for card in range(52))
+
 
 class Mapper:
-    """ 
+    """
     Mapper class for mapping the integer representation of a hand
     to a string representation of the hand for readability.
-    
+
     Cards are 0-12: 2, 3, 4, 5, 6, 7, 8, 9, 10, Jack, Queen, King, Ace
     Suits are 0-3: Clubs, Diamonds, Hearts, Spades
+
+    Also holds the packed 32-bit card encoding (Cactus-Kev layout)
+    used by the simulator:
+
+        xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+    bit 16+rank is the rank bit, bits 12-15 are a one-hot suit,
+    bits 8-11 are the rank as an integer, and bits 0-7 are a prime
+    number unique to the rank so that products of primes identify
+    rank multisets.
     """
+    # one prime per rank (2, 3, ..., A)
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
     def __init__(self):
-        self.suits = ["♣", "♦", "♥", "♠"]
-        self.ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", 
-                      "J", "Q", "K", "A"]
-    
-    def card_string(self, card : tuple):
-        """ 
+        self.suits = SUITS
+        self.ranks = RANKS
+        # 52-entry lookup from deck integer (suit*13 + rank) to packed card
+        self.cactus = np.array(
+            [(1 << (16 + card % 13))
+             | (1 << (12 + card // 13))
+             | ((card % 13) << 8)
+             | self.primes[card % 13]
+             for card in range(52)],
+            dtype=np.uint32
+        )
+        self._by_packed = {int(self.cactus[card]): CARD_STR[card]
+                           for card in range(52)}
+
+    @staticmethod
+    def cactus_rank(card : int):
+        """
+        Get the rank (0-12) of a packed card
+
+        Args:
+            card (int): a packed 32-bit card
+
+        Returns:
+            rank (int): the rank of the card
+        """
+        return (int(card) >> 8) & 0xF
+
+    @staticmethod
+    def cactus_suit(card : int):
+        """
+        Get the suit (0-3) of a packed card
+
+        Args:
+            card (int): a packed 32-bit card
+
+        Returns:
+            suit (int): the suit of the card
+        """
+        # one-hot suit nibble, so count trailing zeros
+        return (((int(card) >> 12) & 0xF).bit_length()) - 1
+
+    def to_tuples(self, cards):
+        """
+        Convert packed 32-bit cards to (suit, rank) tuples
+
+        Args:
+            cards: iterable of packed 32-bit cards
+
+        Returns:
+            cards as list of tuples (suit, rank)
+        """
+        return [(self.cactus_suit(card), self.cactus_rank(card)) for card in cards]
+
+    def card_string(self, card):
+        """
         Get the string representation of a card
-        
+
         Args:
-            card (tuple): a card as tuple (suit, rank)
-        
+            card: a card as tuple (suit, rank) or packed 32-bit int
+
         Returns:
             card_string (str): the string representation of the card
         """
-        return self.ranks[card[1]] + self.suits[card[0]]
\ No newline at end of file
+        if isinstance(card, tuple):
+            return CARD_STR[card[0] * 13 + card[1]]
+        return self._by_packed[int(card)]
@@ -1,6 +1,220 @@
+from collections import Counter
+from heapq import nlargest
+from itertools import combinations_with_replacement
+from operator import itemgetter
+
 import numpy as np
 from mapper import Mapper
 
+# A, 2, 3, 4, 5 as a 13-bit rank mask (rank 0 is the deuce)
+WHEEL = 0b1000000001111
+
+
+def _build_straight_top():
+    """
+    Tabulate the top straight rank for every 13-bit rank mask,
+    -1 where the mask holds no straight, so the straight test
+    becomes a single table lookup.
+    """
+    table = [-1] * (1 << 13)
+    for mask in range(1 << 13):
+        for top in range(12, 3, -1):
+            if (mask >> (top - 4)) & 0b11111 == 0b11111:
+                table[mask] = top
+                break
+        else:
+            if mask & WHEEL == WHEEL:
+                table[mask] = 3
+    return table
+
+
+STRAIGHT_TOP = _build_straight_top()
+
+# base-5 digit weights for the rank-multiset key (counts never exceed 4)
+_POW5 = tuple(5 ** rank for rank in range(13))
+
+
+def _score_ranks(rcount : list):
+    """
+    Score a non-flush hand from its per-rank card counts, walking the
+    categories from the best down with the same tie handling as the
+    evaluator: the highest trips wins a full house, the highest pair
+    scores pairs and two pairs.
+    """
+    if 4 in rcount:
+        return 91 + rcount.index(4)
+    # two trips make a full house just as well as trips and a pair
+    if 3 in rcount and (2 in rcount or rcount.count(3) == 2):
+        return 78 + max(rank for rank in range(13) if rcount[rank] == 3)
+    rank_mask = 0
+    for rank in range(13):
+        if rcount[rank]:
+            rank_mask |= 1 << rank
+    top = STRAIGHT_TOP[rank_mask]
+    if top >= 0:
+        return 52 + top
+    if 3 in rcount:
+        return 39 + rcount.index(3)
+    if rcount.count(2) >= 2:
+        return 26 + max(rank for rank in range(13) if rcount[rank] == 2)
+    if 2 in rcount:
+        return 13 + rcount.index(2)
+    return rank_mask.bit_length() - 1
+
+
+def _build_rank_score():
+    """
+    Score every reachable rank multiset of up to 7 cards, keyed by the
+    base-5 count key. Flush hands go through FLUSH_SCORE instead; a
+    7-card hand cannot hold both a flush and quads or a full house, so
+    the two tables never compete.
+    """
+    table = {}
+    for n_cards in range(1, 8):
+        for combo in combinations_with_replacement(range(13), n_cards):
+            rcount = [0] * 13
+            for rank in combo:
+                rcount[rank] += 1
+            if max(rcount) > 4:
+                continue
+            key = sum(_POW5[rank] for rank in combo)
+            table[key] = _score_ranks(rcount)
+    return table
+
+
+def _build_flush_score():
+    """
+    Score every 13-bit rank mask holding 5 or more cards of one suit:
+    royal/straight flush where the mask holds a straight, plain flush
+    otherwise.
+    """
+    table = [-1] * (1 << 13)
+    for mask in range(1 << 13):
+        if mask.bit_count() < 5:
+            continue
+        top = STRAIGHT_TOP[mask]
+        if top == 12:
+            table[mask] = 117
+        elif top >= 0:
+            table[mask] = 104 + top
+        else:
+            table[mask] = 65 + mask.bit_length() - 1
+    return table
+
+
+RANK_SCORE = _build_rank_score()
+FLUSH_SCORE = _build_flush_score()
+
+
+# numpy views of the score tables plus a highest-set-bit table, for the
+# vectorized batch classifier
+_STRAIGHT_TOP_NP = np.array(STRAIGHT_TOP, dtype=np.int32)
+_FLUSH_SCORE_NP = np.array(FLUSH_SCORE, dtype=np.int32)
+_TOP_BIT = np.array([mask.bit_length() - 1 for mask in range(1 << 13)], dtype=np.int32)
+
+
+def classify_batch(hands):
+    """
+    Score a batch of packed hands with vectorized numpy ops.
+
+    The per-hand logic mirrors _score_masks: suit masks are built per
+    hand, rank multiplicities come from branchless mask combinations,
+    and the straight/flush tables are gathered per row. Useful for
+    Monte-Carlo equity runs where thousands of boards are scored at
+    once.
+
+    Args:
+        hands (np.ndarray): (n, k) matrix of packed 32-bit cards
+
+    Returns:
+        scores (np.ndarray): (n,) int32 hand ranks
+    """
+    cards = np.asarray(hands, dtype=np.int64)
+    ranks = (cards >> 8) & 0xF
+    nibbles = (cards >> 12) & 0xF
+    rank_bits = np.int64(1) << ranks
+
+    # one 13-bit rank mask per suit per hand
+    suit_masks = np.stack([
+        np.bitwise_or.reduce(np.where(nibbles == (1 << suit), rank_bits, 0), axis=1)
+        for suit in range(4)
+    ])
+    m0, m1, m2, m3 = suit_masks
+    rank_mask = m0 | m1 | m2 | m3
+
+    quads = m0 & m1 & m2 & m3
+    trips_or_more = (m0 & m1 & m2) | (m0 & m1 & m3) | (m0 & m2 & m3) | (m1 & m2 & m3)
+    pairs_or_more = (m0 & m1) | (m0 & m2) | (m0 & m3) | (m1 & m2) | (m1 & m3) | (m2 & m3)
+    trips = trips_or_more & ~quads
+    pairs = pairs_or_more & ~trips_or_more
+
+    # build the score from the weakest category up; each category
+    # overwrites the ones below it, the flush table wins outright
+    scores = _TOP_BIT[rank_mask]
+    scores = np.where(pairs != 0, 13 + _TOP_BIT[pairs], scores)
+    scores = np.where(np.bitwise_count(pairs) >= 2, 26 + _TOP_BIT[pairs], scores)
+    scores = np.where(trips != 0, 39 + _TOP_BIT[trips], scores)
+    straight_top = _STRAIGHT_TOP_NP[rank_mask]
+    scores = np.where(straight_top >= 0, 52 + straight_top, scores)
+    full = (trips != 0) & ((pairs != 0) | (np.bitwise_count(trips) >= 2))
+    scores = np.where(full, 78 + _TOP_BIT[trips], scores)
+    scores = np.where(quads != 0, 91 + _TOP_BIT[quads], scores)
+
+    flush = np.bitwise_count(suit_masks) >= 5
+    flush_mask = np.bitwise_or.reduce(np.where(flush, suit_masks, 0), axis=0)
+    scores = np.where(flush.any(axis=0), _FLUSH_SCORE_NP[flush_mask], scores)
+
+    return scores.astype(np.int32)
+
+
+def _score_masks(suit_masks : list, rank_mask : int):
+    """
+    Score a hand straight from its four suit masks.
+
+    Rank multiplicities come from branchless mask combinations (a rank
+    sits in the quads/trips/pairs mask according to how many suits hold
+    it), so no per-rank walk is needed. Bands and tie handling match the
+    evaluator: the highest trips wins a full house, the highest pair
+    scores pairs and two pairs.
+    """
+    m0, m1, m2, m3 = suit_masks
+    for mask in suit_masks:
+        if mask.bit_count() >= 5:
+            # a 7-card hand with a flush can hold neither quads nor a
+            # full house, so the flush table decides outright
+            return FLUSH_SCORE[mask]
+
+    quads = m0 & m1 & m2 & m3
+    if quads:
+        return 91 + quads.bit_length() - 1
+
+    trips_or_more = (m0 & m1 & m2) | (m0 & m1 & m3) | (m0 & m2 & m3) | (m1 & m2 & m3)
+    pairs_or_more = (m0 & m1) | (m0 & m2) | (m0 & m3) | (m1 & m2) | (m1 & m3) | (m2 & m3)
+    trips = trips_or_more & ~quads
+    pairs = pairs_or_more & ~trips_or_more
+
+    if trips and (pairs or trips.bit_count() >= 2):
+        return 78 + trips.bit_length() - 1
+
+    top = STRAIGHT_TOP[rank_mask]
+    if top >= 0:
+        return 52 + top
+
+    if trips:
+        return 39 + trips.bit_length() - 1
+    if pairs:
+        if pairs.bit_count() >= 2:
+            return 26 + pairs.bit_length() - 1
+        return 13 + pairs.bit_length() - 1
+
+    return rank_mask.bit_length() - 1
+
+# evaluator scores memoized per hand composition; suit permutations of
+# the same ranks share an entry, so Monte-Carlo run-outs that redeal the
+# same hand in different suits all hit the cache
+_EVAL_CACHE = {}
+_EVAL_CACHE_MAX = 1 << 20
+
 class PokerRank:
     """ 
     A Texas Hold'em Poker Rules
@@ -13,17 +227,150 @@ class PokerRank:
     The hand is combined with the table cards where each card is a tuple (suit, rank).
     """
 
-    def __init__(self, player_hands : dict, table_cards : list, verbose : bool = False):
+    def __init__(self, player_hands : dict, table_cards=None, verbose : bool = False,
+                 active=None):
+        self.mapper = Mapper()
+        self.rank_player_hands = {}
+        self.player_cards = None
+        # players whose hands matter; folded players are never evaluated
+        players = list(player_hands) if active is None else [p for p in player_hands if p in active]
+
+        if isinstance(next(iter(player_hands.values())), np.ndarray):
+            # packed-card fast path: keep the simulator's uint32 arrays
+            # and only materialise (suit, rank) tuples when a hand needs
+            # them (verbose output or a tie-break)
+            if table_cards is not None:
+                self.player_cards = {player : np.concatenate((player_hands[player], table_cards))
+                                     for player in players}
+            else:
+                self.player_cards = {player : player_hands[player] for player in players}
+            self.player_hands = {}
+            if verbose:
+                for player, cards in self.player_cards.items():
+                    self.player_hands[player] = self.mapper.to_tuples(cards)
+                    self.rank_player_hands[player] = self.rank_hand_of_player(player, verbose)
+            return
+
         if table_cards is not None:
-            self.player_hands = {player : player_hands[player] + table_cards for player in player_hands}
+            self.player_hands = {player : player_hands[player] + table_cards for player in players}
         else:
-            self.player_hands = player_hands
-        
-        self.mapper = Mapper()       
-        self.rank_player_hands = {}
-        for player in self.player_hands:
-            self.rank_player_hands[player] = self.rank_hand_of_player(player, verbose)
-    
+            self.player_hands = {player : player_hands[player] for player in players}
+
+        if verbose:
+            for player in self.player_hands:
+                self.rank_player_hands[player] = self.rank_hand_of_player(player, verbose)
+
+    def rank_of(self, player : int):
+        """
+        Rank of a player's hand, scored on first use and memoized.
+
+        Args:
+            player (int): the player
+
+        Returns:
+            score (int): the rank of the hand
+        """
+        score = self.rank_player_hands.get(player)
+        if score is None:
+            if self.player_cards is not None:
+                score = self._eval_packed(self.player_cards[player])
+            else:
+                score = self._eval_cached(self.player_hands[player])
+            self.rank_player_hands[player] = score
+        return score
+
+    @staticmethod
+    def encode(cards : list):
+        """
+        Pack a hand into one 13-bit rank mask per suit plus their union,
+        so flush and straight checks are a handful of bitwise ops.
+
+        Args:
+            cards (list): a list of tuples (cards)
+
+        Returns:
+            suit_masks (list): 13-bit rank mask per suit
+            rank_mask (int): union of the four suit masks
+        """
+        suit_masks = [0, 0, 0, 0]
+        for suit, rank in cards:
+            suit_masks[suit] |= 1 << rank
+        return suit_masks, suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+
+    # hand category names indexed by score // 13 (score bands are 13 wide)
+    HAND_NAMES = ("High Card", "1 Pair", "2 Pairs", "3 of a Kind", "Straight",
+                  "Flush", "Full House", "4 of a Kind", "Straight Flush",
+                  "Royal Flush")
+
+    @staticmethod
+    def cards_by_rank(cards : list):
+        """
+        Bucket a hand's cards by rank, preserving card order.
+
+        Args:
+            cards (list): a list of tuples (cards)
+
+        Returns:
+            buckets (list): 13-element list of card lists, one per rank
+        """
+        buckets = [[] for _ in range(13)]
+        for card in cards:
+            buckets[card[1]].append(card)
+        return buckets
+
+    @staticmethod
+    def top_kickers(buckets : list, skip, n_kickers : int):
+        """
+        Pick the highest cards outside the skipped ranks, best first.
+
+        Args:
+            buckets (list): cards bucketed by rank (see cards_by_rank)
+            skip: ranks already used by the hand's main grouping
+            n_kickers (int): how many kickers to pick
+
+        Returns:
+            kickers (list): up to n_kickers cards
+        """
+        kickers = []
+        for rank in range(12, -1, -1):
+            if rank in skip:
+                continue
+            for card in buckets[rank]:
+                kickers.append(card)
+                if len(kickers) == n_kickers:
+                    return kickers
+        return kickers
+
+    @staticmethod
+    def rank_counts(cards : list):
+        """
+        Count how many cards of each rank a hand holds.
+
+        Args:
+            cards (list): a list of tuples (cards)
+
+        Returns:
+            rcount (list): 13-element list of per-rank card counts
+        """
+        rcount = [0] * 13
+        for card in cards:
+            rcount[card[1]] += 1
+        return rcount
+
+    @staticmethod
+    def straight_top(rank_mask : int):
+        """
+        Top card rank of the straight in a 13-bit rank mask, -1 if there
+        is none. The wheel (A-2-3-4-5) counts with the 5 as its top card.
+
+        Args:
+            rank_mask (int): 13-bit rank mask
+
+        Returns:
+            top (int): rank of the straight's top card, -1 if no straight
+        """
+        return STRAIGHT_TOP[rank_mask]
+
     def is_royal_flush(self, hand : list):
         """ 
         Check if a hand is a royal flush
@@ -34,15 +381,12 @@ class PokerRank:
         Returns:
             is_royal_flush (bool): True if the hand is a royal flush, False otherwise
         """
-        flush, flush_cards = self.is_flush(hand)
-        straight = False
+        straight_flush, straight_cards = self.is_straight_flush(hand)
 
-        if flush:
-            straight, straight_cards = self.is_straight(flush_cards)
-        
-        if (flush & straight) and (self.get_rank_of_highest_card(hand) == 12):
+        # straight cards come top-first, so a royal tops out at the ace
+        if straight_flush and straight_cards[0][1] == 12:
             return True, straight_cards
-        
+
         return False, None
     
     def is_straight_flush(self, hand : list):
@@ -55,15 +399,17 @@ class PokerRank:
         Returns:
             is_straight_flush (bool): True if the hand is a straight flush, False otherwise
         """
-        flush, flush_cards = self.is_flush(hand) 
+        flush, flush_cards = self.is_flush(hand)
         straight = False
-        
+
         if flush:
-            straight, straight_cards = self.is_straight(flush_cards)
-        
+            # use every card of the flush suit, not just the highest 5
+            suited = [card for card in hand if card[0] == flush_cards[0][0]]
+            straight, straight_cards = self.is_straight(suited)
+
         if flush and straight:
             return True, straight_cards
-        
+
         return False, None
     
     def is_flush(self, cards : list):
@@ -78,18 +424,15 @@ class PokerRank:
         """
         if len(cards) < 5:
             return False, None
-        
-        suits = [card[0] for card in cards]
-        # check if we have 5 cards of the same suit
-        if np.any(np.bincount(suits) >= 5):
-            # get the cards of the flush
-            flush_cards = [card for card in cards if card[0] == np.argmax(np.bincount(suits))]
-            # get the highest 5 cards of the flush
-            flush_cards.sort(key=lambda card: card[1], reverse=True)
-            flush_cards = flush_cards[:5]
-            
-            return True, flush_cards
-        
+
+        suit_masks, _ = self.encode(cards)
+        for suit in range(4):
+            # 5 or more bits set in a suit's rank mask is a flush
+            if suit_masks[suit].bit_count() >= 5:
+                flush_cards = [card for card in cards if card[0] == suit]
+                # get the highest 5 cards of the flush
+                return True, nlargest(5, flush_cards, key=itemgetter(1))
+
         return False, None
     
     def is_straight(self, cards : list):
@@ -102,48 +445,29 @@ class PokerRank:
         Returns:
             is_straight (bool): True if the hand is a straight, False otherwise
         """
-        ranks = [card[1] for card in cards]
-        ranks.sort()
-        # remove any duplicates
-        ranks = np.unique(ranks)
-        if len(ranks) < 5:
+        _, rank_mask = self.encode(cards)
+        top = self.straight_top(rank_mask)
+        if top < 0:
             return False, None
-        
-        cards = [card for card in cards if card[1] in ranks]
-        # remove duplicate ranks from cards
 
-        if len(ranks) < 5:
-            return False, None
-        
-        def unique_ranks(cards):
-            """return only 5 highest ranks with no duplicates"""
-            ranks, _cards = [], []
-            for card in cards:
-                if card[1] not in ranks:
-                    ranks.append(card[1])
-                    _cards.append(card)
-                else:
-                    continue
-            _cards.sort(key=lambda card: card[1], reverse=True)
-            return _cards[:5]
-
-        # take highest straight first
-        if np.all(np.diff(ranks[2:7]) == 1) and len(ranks[2:7]) == 5:
-            straight_cards = [card for card in cards if card[1] in ranks[2:7]]
-            straight_cards = unique_ranks(straight_cards)
-            return True, straight_cards
-        
-        if np.all(np.diff(ranks[1:6]) == 1) and len(ranks[1:6]) == 5:
-            straight_cards = [card for card in cards if card[1] in ranks[1:6]]
-            straight_cards = unique_ranks(straight_cards)
-            return True, straight_cards
-        
-        if np.all(np.diff(ranks[:5]) == 1) and len(ranks[:5]) == 5:
-            straight_cards = [card for card in cards if card[1] in ranks[:5]]
-            straight_cards = unique_ranks(straight_cards)
-            return True, straight_cards
-        
-        return False, None
+        return True, self.straight_hand(cards, top)
+
+    @staticmethod
+    def straight_hand(cards : list, top : int):
+        """
+        Pick one card per rank of a straight, top card first.
+
+        Args:
+            cards (list): a list of tuples (cards)
+            top (int): rank of the straight's top card
+
+        Returns:
+            hand (list): the 5 straight cards; the wheel wraps to the ace
+        """
+        straight_ranks = [(top - i) % 13 for i in range(5)] if top == 3 \
+            else [top - i for i in range(5)]
+        by_rank = {card[1] : card for card in cards}
+        return [by_rank[rank] for rank in straight_ranks]
 
     
     def is_4_of_a_kind(self, cards : list):
@@ -156,19 +480,14 @@ class PokerRank:
         Returns:
             is_4_of_a_kind (bool): True if the hand is a 4 of a kind, False otherwise
         """
-        ranks = np.array([card[1] for card in cards])
-        # get the unique ranks and their counts
-        _, counts = np.unique(ranks, return_counts=True)
-        
-        if np.any(counts == 4):
-            # get the cards of the 4 of a kind
-            four_of_a_kind_cards = [card for card in cards if card[1] == np.argmax(np.bincount(ranks))]
-            cards = [card for card in cards if card not in four_of_a_kind_cards]
-            # get the highest card of the remaining cards
-            highest_card = self.get_highest_card(cards)
-            hand = four_of_a_kind_cards + [highest_card]
+        rcount = self.rank_counts(cards)
+
+        if 4 in rcount:
+            rank = rcount.index(4)
+            buckets = self.cards_by_rank(cards)
+            hand = buckets[rank] + self.top_kickers(buckets, (rank,), 1)
             return True, hand
-        
+
         return False, None
     
     def is_full_house(self, cards : list):
@@ -181,17 +500,17 @@ class PokerRank:
         Returns:
             is_full_house (bool): True if the hand is a full house, False otherwise
         """
-        ranks = np.array([card[1] for card in cards])
-        _, counts = np.unique(ranks, return_counts=True)
-        
-        # TODO could be two 3 of a kind and two pairs, need to check for that
-
-        if np.any(counts == 3) and np.any(counts == 2):
-            three_of_a_kind_cards = [card for card in cards if card[1] == np.argmax(np.bincount(ranks))]
-            cards = [card for card in cards if card not in three_of_a_kind_cards]
-            ranks = np.array([card[1] for card in cards])
-            two_of_a_kind_cards = [card for card in cards if card[1] == np.argmax(np.bincount(ranks))]
-            hand = three_of_a_kind_cards + two_of_a_kind_cards
+        counts = Counter(card[1] for card in cards)
+
+        trips = [rank for rank, n in counts.items() if n == 3]
+        pairs = [rank for rank, n in counts.items() if n == 2]
+        # two trips make a full house too: the highest trips plus two
+        # cards of the best remaining rank with at least a pair
+        if trips and (pairs or len(trips) == 2):
+            top_trips = max(trips)
+            pair_rank = max(rank for rank in trips + pairs if rank != top_trips)
+            buckets = self.cards_by_rank(cards)
+            hand = buckets[top_trips] + buckets[pair_rank][:2]
             return True, hand
 
         return False, None
@@ -206,21 +525,15 @@ class PokerRank:
         Returns:
             is_3_of_a_kind (bool): True if the hand is a 3 of a kind, False otherwise
         """
-        ranks = np.array([card[1] for card in cards])
-        _, counts = np.unique(ranks, return_counts=True)
-        
-        if np.any(counts == 3):
-            three_of_a_kind_cards = [card for card in cards if card[1] == np.argmax(np.bincount(ranks))]
-            cards = [card for card in cards if card not in three_of_a_kind_cards]
-            cards.sort(key=lambda card: card[1], reverse=True)
-            
-            for i in range(2):
-                highest_card = self.get_highest_card(cards[i:])
-                three_of_a_kind_cards.append(highest_card)
-
-            hand = three_of_a_kind_cards
+        rcount = self.rank_counts(cards)
+
+        if 3 in rcount:
+            # highest trips, matching the evaluator's tie handling
+            rank = max(r for r in range(13) if rcount[r] == 3)
+            buckets = self.cards_by_rank(cards)
+            hand = buckets[rank] + self.top_kickers(buckets, (rank,), 2)
             return True, hand
-        
+
         return False, None
     
     def is_2_pairs(self, cards : list):
@@ -233,19 +546,17 @@ class PokerRank:
         Returns:
             is_2_pairs (bool): True if the hand is a 2 pairs, False otherwise
         """
-        ranks = np.array([card[1] for card in cards])
+        counts = Counter(card[1] for card in cards)
 
-        arr, counts = np.unique(ranks, return_counts=True)
-        
-        if np.sum(counts == 2) == 2:
-            # find the 2 pairs
-            pairs = arr[np.where(counts == 2)]
+        pairs = sorted(rank for rank, n in counts.items() if n == 2)
+        if len(pairs) >= 2:
+            # top two pairs only; a third pair's cards stay kicker candidates
+            pairs = pairs[-2:]
+            buckets = self.cards_by_rank(cards)
             hand = [card for card in cards if card[1] in pairs]
-            cards = [card for card in cards if card not in hand]
-            highest_card = self.get_highest_card(cards)
-            hand.append(highest_card)
+            hand += self.top_kickers(buckets, pairs, 1)
             return True, hand
-        
+
         return False, None
     
     def is_1_pair(self, cards : list):
@@ -258,23 +569,16 @@ class PokerRank:
         Returns:
             is_1_pair (bool): True if the hand is a 1 pair, False otherwise
         """
-        ranks = np.array([card[1] for card in cards])
-
-        arr, counts = np.unique(ranks, return_counts=True)
-
-        if np.any(counts == 2):
-            # get the rank that appears 2 times
-            pair = arr[np.where(counts == 2)][0]
-            hand = [card for card in cards if card[1] == pair]
-            cards = [card for card in cards if card not in hand]
-            cards.sort(key=lambda card: card[1], reverse=True)
-            if len(cards) < 3:
-                return True, hand
-            for i in range(3):
-                highest_card = self.get_highest_card(cards[i:])
-                hand.append(highest_card)
-            return True, hand
-        
+        rcount = self.rank_counts(cards)
+
+        if 2 in rcount:
+            # highest rank that appears 2 times
+            pair = max(r for r in range(13) if rcount[r] == 2)
+            buckets = self.cards_by_rank(cards)
+            hand = buckets[pair]
+            # short hands simply yield fewer kickers
+            return True, hand + self.top_kickers(buckets, (pair,), 3)
+
         return False, None
     
     def is_high_card(self, cards : list):
@@ -288,9 +592,7 @@ class PokerRank:
             is_high_card (bool): True if the hand is a high card, False otherwise
         """
         # get the 5 highest cards
-        cards.sort(key=lambda card: card[1], reverse=True)
-        hand = cards[:5]
-        return True, hand
+        return True, nlargest(5, cards, key=itemgetter(1))
     
     def get_highest_card(self, cards):
         """ 
@@ -301,10 +603,7 @@ class PokerRank:
         Returns:
             card (tuple): the highest card
         """
-        cards_str = [self.mapper.card_string(card) for card in cards]
-
-        cards.sort(key=lambda card: card[1], reverse=True)
-        return cards[0]
+        return max(cards, key=itemgetter(1))
     
     
     def get_rank_of_highest_card(self, cards : list):
@@ -317,9 +616,7 @@ class PokerRank:
         Returns:
             rank (int): the rank of the highest card
         """
-        ranks = [card[1] for card in cards]
-        ranks.sort()
-        return ranks[-1]
+        return max(card[1] for card in cards)
     
     # all functions below get a hand of five cards (2 from player and 3 from table)
     # the hand is a list of tuples (suit, rank)
@@ -335,10 +632,8 @@ class PokerRank:
             rank (int): the rank of the 4 of a kind
         """
         # get 4 of a kind rank
-        ranks = [card[1] for card in hand]
-        arr, counts = np.unique(ranks, return_counts=True)
-        rank = arr[np.where(counts == 4)][0]
-        
+        rank = self.rank_counts(hand).index(4)
+
         return 91 + rank
     
     def get_rank_of_3_of_a_kind(self, hand : list):
@@ -352,10 +647,8 @@ class PokerRank:
             rank (int): the rank of the 3 of a kind
         """
         # get 3 of a kind rank
-        ranks = [card[1] for card in hand]
-        arr, counts = np.unique(ranks, return_counts=True)
-        rank = arr[np.where(counts == 3)][0]
-        
+        rank = self.rank_counts(hand).index(3)
+
         return 39 + rank
     
     def get_rank_of_2_pairs(self, hand : list):
@@ -369,11 +662,9 @@ class PokerRank:
             rank (int): the rank of the 2 pairs
         """
         # get 2 pairs ranks
-        ranks = [card[1] for card in hand]
-        arr, counts = np.unique(ranks, return_counts=True)
-        pairs = arr[np.where(counts == 2)]
-        rank = np.max(pairs)
-        
+        rcount = self.rank_counts(hand)
+        rank = max(rank for rank in range(13) if rcount[rank] == 2)
+
         return 26 + rank
     
     def get_rank_of_1_pair(self, hand : list):
@@ -387,10 +678,8 @@ class PokerRank:
             rank (int): the rank of the 1 pair
         """
         # get 1 pair rank
-        ranks = [card[1] for card in hand]
-        arr, counts = np.unique(ranks, return_counts=True)
-        rank = arr[np.where(counts == 2)][0]
-        
+        rank = self.rank_counts(hand).index(2)
+
         return 13 + rank
 
     def get_rank_full_house(self, hand : list):
@@ -404,10 +693,8 @@ class PokerRank:
             rank (int): the rank of the full house
         """
         # get 3 of a kind rank
-        ranks = [card[1] for card in hand]
-        arr, counts = np.unique(ranks, return_counts=True)
-        three_of_a_kind_rank = arr[np.where(counts == 3)][0]
-        
+        three_of_a_kind_rank = self.rank_counts(hand).index(3)
+
         return 78 + three_of_a_kind_rank
     
     def get_rank_straight(self, hand : list):
@@ -420,11 +707,11 @@ class PokerRank:
         Returns:
             rank (int): the rank of the straight
         """
-        # get the highest card of the straight
+        # get the highest card of the straight; the wheel tops out at the 5
         ranks = [card[1] for card in hand]
         ranks.sort()
-        rank = ranks[-1]
-        
+        rank = 3 if ranks == [0, 1, 2, 3, 12] else ranks[-1]
+
         return 52 + rank
     
     def get_rank_flush(self, hand : list):
@@ -437,13 +724,10 @@ class PokerRank:
         Returns:
             rank (int): the rank of the flush
         """
-        # get the highest card of the flush
-        suits = [card[0] for card in hand]
-        suit = np.argmax(np.bincount(suits))
-        ranks = [card[1] for card in hand if card[0] == suit]
-        ranks.sort()
-        rank = ranks[-1]
-        
+        # a materialised flush hand is all one suit, so the highest
+        # card is simply the highest rank
+        rank = max(card[1] for card in hand)
+
         return 65 + rank
     
     def get_rank_straight_flush(self, hand : list):
@@ -456,13 +740,11 @@ class PokerRank:
         Returns:
             rank (int): the rank of the straight flush
         """
-        # get the highest card of the straight flush
-        suits = [card[0] for card in hand]
-        suit = np.argmax(np.bincount(suits))
-        ranks = [card[1] for card in hand if card[0] == suit]
-        ranks.sort()
-        rank = ranks[-1]
-        
+        # a materialised straight flush is all one suit; the wheel tops
+        # out at the 5
+        ranks = sorted(card[1] for card in hand)
+        rank = 3 if ranks == [0, 1, 2, 3, 12] else ranks[-1]
+
         return 104 + rank
     
     def get_rank_royal_flush(self, hand : list = None):
@@ -478,6 +760,182 @@ class PokerRank:
         """
         return 117
     
+    def _eval_cached(self, cards : list):
+        """
+        Score a hand from its suit masks, memoizing per composition.
+
+        The cache key is the base-5 rank-multiset key plus the flush
+        suit's rank mask (0 when there is no flush), which together
+        determine the score.
+
+        Args:
+            cards (list): a list of tuples (cards)
+
+        Returns:
+            score (int): the rank of the hand
+        """
+        suit_masks, rank_mask = self.encode(cards)
+        flush_mask = 0
+        for suit in range(4):
+            if suit_masks[suit].bit_count() >= 5:
+                flush_mask = suit_masks[suit]
+                break
+
+        key = (sum(_POW5[card[1]] for card in cards), flush_mask)
+        score = _EVAL_CACHE.get(key)
+        if score is None:
+            score = _score_masks(suit_masks, rank_mask)
+            if len(_EVAL_CACHE) >= _EVAL_CACHE_MAX:
+                _EVAL_CACHE.clear()
+            _EVAL_CACHE[key] = score
+        return score
+
+    def _eval_packed(self, cards):
+        """
+        Score a packed hand without converting to tuples, sharing the
+        composition memo with _eval_cached.
+
+        Args:
+            cards (np.ndarray): packed 32-bit cards
+
+        Returns:
+            score (int): the rank of the hand
+        """
+        suit_masks = [0, 0, 0, 0]
+        key = 0
+        for card in cards:
+            card = int(card)
+            rank = (card >> 8) & 0xF
+            suit = ((card >> 12) & 0xF).bit_length() - 1
+            suit_masks[suit] |= 1 << rank
+            key += _POW5[rank]
+        flush_mask = 0
+        for suit in range(4):
+            if suit_masks[suit].bit_count() >= 5:
+                flush_mask = suit_masks[suit]
+                break
+
+        score = _EVAL_CACHE.get((key, flush_mask))
+        if score is None:
+            score = _score_masks(suit_masks,
+                                 suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3])
+            if len(_EVAL_CACHE) >= _EVAL_CACHE_MAX:
+                _EVAL_CACHE.clear()
+            _EVAL_CACHE[(key, flush_mask)] = score
+        return score
+
+    def _classify(self, cards : list):
+        """
+        Classify a hand with two table lookups.
+
+        A flush hand is scored by FLUSH_SCORE on its suit mask, anything
+        else by RANK_SCORE on its base-5 rank-multiset key; only the
+        best-5 materialisation still touches the cards themselves.
+
+        Args:
+            cards (list): a list of tuples (cards)
+
+        Returns:
+            score (int): the rank of the hand
+            hand (list): the best 5 cards, strongest grouping first
+        """
+        # preflop short-circuit: under 5 cards no flush or straight is
+        # possible, so the rank table decides (high card or pocket pair)
+        if len(cards) < 5:
+            score = RANK_SCORE[sum(_POW5[card[1]] for card in cards)]
+            return score, self._best_five(cards, score, -1)
+
+        suit_masks, _ = self.encode(cards)
+
+        flush_suit = -1
+        for suit in range(4):
+            if suit_masks[suit].bit_count() >= 5:
+                flush_suit = suit
+                break
+
+        if flush_suit >= 0:
+            score = FLUSH_SCORE[suit_masks[flush_suit]]
+        else:
+            score = RANK_SCORE[sum(_POW5[card[1]] for card in cards)]
+
+        return score, self._best_five(cards, score, flush_suit)
+
+    def _best_five(self, cards : list, score : int, flush_suit : int):
+        """
+        Materialise the best 5 cards of a scored hand, strongest
+        grouping first, following the score's tie handling.
+
+        Args:
+            cards (list): a list of tuples (cards)
+            score (int): the rank of the hand
+            flush_suit (int): the flush suit, -1 if no flush
+
+        Returns:
+            hand (list): the best 5 cards
+        """
+        category = score // 13
+
+        # straight flush / royal flush
+        if category >= 8:
+            suited = [card for card in cards if card[0] == flush_suit]
+            return self.straight_hand(suited, 12 if category == 9 else score - 104)
+
+        by_rank_desc = sorted(cards, key=itemgetter(1), reverse=True)
+
+        # flush
+        if category == 5:
+            suited = [card for card in by_rank_desc if card[0] == flush_suit]
+            return suited[:5]
+
+        # straight
+        if category == 4:
+            return self.straight_hand(cards, score - 52)
+
+        # 4 of a kind
+        if category == 7:
+            rank = score - 91
+            quads = [card for card in cards if card[1] == rank]
+            kickers = [card for card in by_rank_desc if card[1] != rank]
+            return quads + kickers[:1]
+
+        # full house
+        if category == 6:
+            rcount = self.rank_counts(cards)
+            trips_rank = score - 78
+            # the pair half is the best remaining rank with 2+ cards;
+            # a second trips contributes two of its three cards
+            pair_rank = max(rank for rank in range(13)
+                            if rank != trips_rank and rcount[rank] >= 2)
+            trips = [card for card in cards if card[1] == trips_rank]
+            pair = [card for card in cards if card[1] == pair_rank][:2]
+            return trips + pair
+
+        # 3 of a kind
+        if category == 3:
+            rank = score - 39
+            trips = [card for card in cards if card[1] == rank]
+            kickers = [card for card in by_rank_desc if card[1] != rank]
+            return trips + kickers[:2]
+
+        # 2 pairs
+        if category == 2:
+            rcount = self.rank_counts(cards)
+            # top two pairs only; a third pair's cards stay kicker candidates
+            pairs = [rank for rank in range(13) if rcount[rank] == 2][-2:]
+            pair_cards = [card for card in cards if card[1] in pairs]
+            kickers = [card for card in by_rank_desc if card[1] not in pairs]
+            return pair_cards + kickers[:1]
+
+        # 1 pair
+        if category == 1:
+            rank = score - 13
+            pair = [card for card in cards if card[1] == rank]
+            kickers = [card for card in by_rank_desc if card[1] != rank]
+            return pair + kickers[:3]
+
+        # high card
+        return by_rank_desc[:5]
+
     def rank_hand_of_player(self, player : int, verbose : bool):
         """ 
         Rank the hand of a player.
@@ -508,46 +966,18 @@ class PokerRank:
         """
         cards = self.player_hands[player] # 2 cards from player + 5 cards from table
 
-        # loop through all possible hands, terminate when we find a hand. Start with the best hand, then go down
-        hands = {self.is_royal_flush : self.get_rank_royal_flush,
-                 self.is_straight_flush : self.get_rank_straight_flush,
-                 self.is_4_of_a_kind : self.get_rank_of_4_of_a_kind,
-                 self.is_full_house : self.get_rank_full_house,
-                 self.is_flush : self.get_rank_flush,
-                 self.is_straight : self.get_rank_straight,
-                 self.is_3_of_a_kind : self.get_rank_of_3_of_a_kind,
-                 self.is_2_pairs : self.get_rank_of_2_pairs,
-                 self.is_1_pair : self.get_rank_of_1_pair,
-                 self.is_high_card : self.get_rank_of_highest_card
-        }
-        hand_mapper = {
-            self.get_rank_royal_flush : "Royal Flush",
-            self.get_rank_straight_flush : "Straight Flush",
-            self.get_rank_of_4_of_a_kind : "4 of a Kind",
-            self.get_rank_full_house : "Full House",
-            self.get_rank_flush : "Flush",
-            self.get_rank_straight : "Straight",
-            self.get_rank_of_3_of_a_kind : "3 of a Kind",
-            self.get_rank_of_2_pairs : "2 Pairs",
-            self.get_rank_of_1_pair : "1 Pair",
-            self.get_rank_of_highest_card : "High Card"
-        }   
-        
-        for fn_check, fn_rank in hands.items():
-            is_hand, hand = fn_check(cards)
-            if is_hand:
-                map_hand = [self.mapper.card_string(card) for card in hand]
-                if verbose:
-                    print("-"*20)
-                    print(f"Player {player+1} - {hand_mapper[fn_rank]}:")
-                    hand_string = ", ".join(map_hand)
-                    print(f"{hand_string}")
-                    print("-"*20 + "\n")
-                self.player_hands[player] = hand
-                return fn_rank(hand)
-        
-        # if we get here, we have no hand, so the rank is the rank of the highest card
-        return self.get_rank_of_highest_card(cards)
+        score, hand = self._classify(cards)
+
+        if verbose:
+            map_hand = [self.mapper.card_string(card) for card in hand]
+            print("-"*20)
+            print(f"Player {player+1} - {self.HAND_NAMES[score // 13]}:")
+            hand_string = ", ".join(map_hand)
+            print(f"{hand_string}")
+            print("-"*20 + "\n")
+
+        self.player_hands[player] = hand
+        return score
     
     def get_winner(self):
         """ 
@@ -555,45 +985,35 @@ class PokerRank:
 
         If any players have the same highest rank, we compare the second highest rank, and so on.
         """
-        # first sort the players by their rank
-        sorted_players = sorted(self.rank_player_hands, key=self.rank_player_hands.get, reverse=True)
+        # first sort the players by their rank, scoring lazily
+        players = self.player_cards if self.player_cards is not None else self.player_hands
+        sorted_players = sorted(players, key=self.rank_of, reverse=True)
         # check if any set of players have the same rank as the highest rank
-        highest_rank = self.rank_player_hands[sorted_players[0]]
-        
+        highest_rank = self.rank_of(sorted_players[0])
+
         players_with_highest_rank = []
-        
+
         for player in sorted_players:
-            if self.rank_player_hands[player] == highest_rank:
+            if self.rank_of(player) == highest_rank:
                 players_with_highest_rank.append(player)
             else:
                 break
         
         if len(players_with_highest_rank) == 1:
             return players_with_highest_rank
-        
-        # get the hands of the tied players
-        player_hands = {player : self.player_hands[player] for player in players_with_highest_rank}
-        # sort the hands of the tied players by rank of cards from hand + table cards
-        sorted_players_hands = {player : sorted(player_hands[player], key=lambda card: card[1], reverse=True) for player in player_hands}
-        # compare sorted ranks card by card until we find winner(s)
-        players_removed = []
-        
-        for player1, hand1 in sorted_players_hands.items():
-            for player2, hand2 in sorted_players_hands.items():
-                if player1 == player2:
-                    continue
-                for i in range(5):
-                    if hand1[i][1] > hand2[i][1]:
-                        if player2 not in players_removed:
-                            players_removed.append(player2)
-                        break
-                    if hand1[i][1] < hand2[i][1]:
-                        if player1 not in players_removed:
-                            players_removed.append(player1)
-                        break
-        
-        for player in players_removed:
-            players_with_highest_rank.remove(player)
-        
-        return players_with_highest_rank
+
+        # reduce tied hands to their best 5 cards if the fast path skipped it
+        for player in players_with_highest_rank:
+            if player not in self.player_hands:
+                self.player_hands[player] = self.mapper.to_tuples(self.player_cards[player])
+            if len(self.player_hands[player]) > 5:
+                self.rank_hand_of_player(player, verbose=False)
+
+        # compare tied hands card by card through one tuple key per player;
+        # everyone matching the best key splits the pot
+        keys = {player : tuple(sorted((card[1] for card in self.player_hands[player]), reverse=True))
+                for player in players_with_highest_rank}
+        best_key = max(keys.values())
+
+        return [player for player in players_with_highest_rank if keys[player] == best_key]
                 